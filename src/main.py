@@ -4,99 +4,275 @@ Main module for Mr-Myter.
 Coordinates functions and modules for automated YouTube video upload.
 """
 
+from __future__ import annotations
+
 import os
+import queue
+import threading
 import time
-import traceback
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+from utility import (
+    FAST,
+    MAX_CONCURRENCY,
+    UPLOAD_BACKEND,
+    VideoJob,
+    clear_file_index,
+    flush_log,
+    log,
+    mrjxtr,
+    prefetch_file_index,
+)
+
+# Uploader and driver classes pull in Selenium or the Google client, so they
+# are only imported once a backend is chosen
+if TYPE_CHECKING:
+    from utility import ApiUploader, ChromeDriver, YouTubeUploader
+
+    Uploader = YouTubeUploader | ApiUploader
+
+# Supported video file extensions (lowercase)
+VIDEO_EXTS: frozenset[str] = frozenset({".mp4", ".avi", ".mov"})
+
+
+def pause(seconds: float) -> None:
+    """
+    Sleep for a cosmetic pause unless running in fast mode.
+
+    Args:
+        seconds: Time to sleep in seconds.
+    """
+    if not FAST:
+        time.sleep(seconds)
 
-from utility import ChromeDriver, YouTubeUploader, mrjxtr
+
+def ask(prompt: str) -> str:
+    """
+    Prompt the user after writing out any buffered log messages.
+
+    Args:
+        prompt: Question shown to the user.
+
+    Returns:
+        str: Lowercased answer.
+    """
+    flush_log()
+    return input(prompt).lower()
+
+
+def countdown() -> None:
+    """
+    Print a 3-second countdown, pausing between numbers unless in fast mode.
+    """
+    for i in range(3, 0, -1):
+        log.info(f"{i}...")
+        pause(1)
+
+
+def iter_videos(videos_folder: str) -> Iterator[VideoJob]:
+    """
+    Yield videos in a folder as the directory is read.
+
+    Args:
+        videos_folder: Absolute path of the folder to scan.
+
+    Yields:
+        VideoJob: Each video file with a supported extension.
+    """
+    with os.scandir(videos_folder) as entries:
+        for entry in entries:
+            title, ext = os.path.splitext(entry.name)
+            if ext.lower() in VIDEO_EXTS and entry.is_file(follow_symlinks=False):
+                yield VideoJob.from_entry(entry, videos_folder, title)
+
+
+def upload_videos(
+    uploaders: list[Uploader],
+    video_files: Iterable[VideoJob],
+    total_videos: int,
+    max_active: int,
+) -> None:
+    """
+    Upload videos concurrently, one at a time per uploader.
+
+    At most `max_active` uploads are being filled in at once. An uploader
+    that is only waiting for its video to finish processing does not count
+    towards that limit, so the next video starts on a spare one meanwhile.
+
+    Args:
+        uploaders: Uploaders that can run independently of each other.
+        video_files: Videos to upload.
+        total_videos: Number of videos, for progress messages.
+        max_active: Maximum number of uploads being filled in at once.
+    """
+    idle: queue.SimpleQueue[Uploader] = queue.SimpleQueue()
+    for uploader in uploaders:
+        idle.put(uploader)
+    active = threading.BoundedSemaphore(max_active)
+
+    def run(uploader: Uploader, index: int, video_job: VideoJob) -> None:
+        try:
+            with active:
+                started = uploader.start_upload(video_job, index, total_videos)
+            if started:
+                uploader.finalize_upload(index, total_videos)
+        finally:
+            idle.put(uploader)
+
+    # Only unfinished uploads are kept, and there are never more of those
+    # than uploaders, since each one waits for an idle uploader
+    pending: set[Future] = set()
+    with ThreadPoolExecutor(max_workers=len(uploaders)) as pool:
+        for index, video_job in enumerate(video_files, start=1):
+            pending.add(pool.submit(run, idle.get(), index, video_job))
+            finished, pending = wait(pending, timeout=0)
+            for future in finished:
+                future.result()
+        for future in pending:
+            future.result()
+
+
+def setup_studio_uploaders(chrome_driver: ChromeDriver) -> list[Uploader]:
+    """
+    Start Chrome and create one Studio uploader per worker.
+
+    Args:
+        chrome_driver: Chrome manager that owns every WebDriver session.
+
+    Returns:
+        list: Uploaders, MAX_CONCURRENCY of them when all workers start.
+
+    Raises:
+        Exception: If driver initialization fails.
+    """
+    from utility import YouTubeUploader
+
+    chrome_driver.start_chrome_debugger()
+    driver = chrome_driver.setup_driver()
+    if not driver:
+        raise Exception("Failed to initialize WebDriver")
+
+    # The main tab takes the first upload, and each extra worker one more
+    uploaders: list[Uploader] = [YouTubeUploader(driver)]
+    for worker in range(1, MAX_CONCURRENCY):
+        worker_driver = chrome_driver.open_worker_driver(worker)
+        if worker_driver:
+            uploaders.append(YouTubeUploader(worker_driver))
+    return uploaders
+
+
+def setup_api_uploaders() -> list[Uploader]:
+    """
+    Sign in to the YouTube Data API and create one uploader per worker.
+
+    Returns:
+        list: MAX_CONCURRENCY API uploaders.
+    """
+    from utility import ApiUploader, load_credentials
+
+    credentials = load_credentials()
+    return [ApiUploader(credentials) for _ in range(MAX_CONCURRENCY)]
 
 
 def main() -> None:
     """
     Execute YouTube video upload process.
 
-    1. Initialize Chrome driver
-    2. Locate video files
-    3. Upload videos to YouTube
+    1. Locate video files
+    2. Initialize Chrome driver, or the YouTube Data API client, once there
+       are videos to upload
+    3. Upload videos to YouTube, in parallel workers if configured
     4. Handle user input for termination or restart
     5. Manage exceptions and cleanup
 
     Raises:
         Exception: If driver initialization fails.
     """
+    chrome_driver = None
+    # Set up on the first pass that finds videos, so an empty folder never
+    # starts Chrome or signs in
+    uploaders: list[Uploader] | None = None
     try:
         mrjxtr.print_intro()
-        chrome_driver = ChromeDriver()
-        chrome_driver.start_chrome_debugger()
-        driver = chrome_driver.setup_driver()
-        if not driver:
-            raise Exception("Failed to initialize WebDriver")
 
-        uploader = YouTubeUploader(driver)
+        script_dir = os.path.dirname(__file__)
+        videos_folder = os.path.abspath(os.path.join(script_dir, "../videos"))
 
         while True:
-            script_dir = os.path.dirname(__file__)
-            videos_folder = os.path.abspath(os.path.join(script_dir, "../videos"))
-            print(
+            clear_file_index()
+            # Index sidecar files while the videos are counted
+            prefetch_file_index(videos_folder)
+            log.info(
                 f"Checking for videos in: ...{os.path.sep}{os.path.basename(videos_folder)}"
             )
 
-            video_files: list[str] = [
-                f
-                for f in os.listdir(videos_folder)
-                if f.endswith((".mp4", ".avi", ".mov"))
-            ]
+            # Scan once, so the progress count matches the videos uploaded
+            video_jobs = list(iter_videos(videos_folder))
+            total_videos = len(video_jobs)
 
-            if not video_files:
-                print("No video files found in the specified folder.")
+            if not total_videos:
+                log.info("No video files found in the specified folder.")
             else:
-                total_videos = len(video_files)
-                print(f"Found {total_videos} video(s) to upload.")
+                log.info(f"Found {total_videos} video(s) to upload.")
+
+                if uploaders is None:
+                    if UPLOAD_BACKEND == "api":
+                        uploaders = setup_api_uploaders()
+                    else:
+                        from utility import ChromeDriver
+
+                        chrome_driver = ChromeDriver()
+                        uploaders = setup_studio_uploaders(chrome_driver)
 
-                for index, video_file in enumerate(video_files, start=1):
-                    video_path = os.path.join(videos_folder, video_file)
-                    uploader.upload_video(video_path, index, total_videos)
+                upload_videos(
+                    uploaders,
+                    video_jobs,
+                    total_videos,
+                    MAX_CONCURRENCY,
+                )
 
-            print("NO MORE VIDEOS TO UPLOAD.")
-            print()
-            print()
-            time.sleep(1)
-            print("YOUTUBE UPLOADER HAS FINISHED.")
+            log.info("NO MORE VIDEOS TO UPLOAD.")
+            log.info("")
+            log.info("")
+            pause(1)
+            log.info("YOUTUBE UPLOADER HAS FINISHED.")
 
             # Ask user if they want to exit or restart
             while True:
-                choice = input("Do you want to exit? ([y]/n): ").lower()
+                choice = ask("Do you want to exit? ([y]/n): ")
                 if choice in ["", "y", "yes"]:
-                    print("Exiting YouTube Uploader. Goodbye!")
+                    log.info("Exiting YouTube Uploader. Goodbye!")
                     return  # Exit the function
                 elif choice in ["n", "no"]:
-                    restart = input(
+                    restart = ask(
                         "Do you want to start YouTube Uploader again? ([y]/n): "
-                    ).lower()
+                    )
                     if restart in ["", "y", "yes"]:
-                        print("Restarting YouTube Uploader in:")
-                        for i in range(3, 0, -1):
-                            print(f"{i}...")
-                            time.sleep(1)
-                        time.sleep(1)
-                        print("Restarting now!")
+                        log.info("Restarting YouTube Uploader in:")
+                        countdown()
+                        pause(1)
+                        # Keep the running Chrome unless it has gone away
+                        if chrome_driver and not chrome_driver.is_connected():
+                            log.info("Chrome is not responding, restarting it...")
+                            chrome_driver.quit_driver()
+                            uploaders = setup_studio_uploaders(chrome_driver)
+                        log.info("Restarting now!")
                         break  # Break the inner loop to restart
                     elif restart in ["n", "no"]:
-                        print("Exiting YouTube Uploader in:")
-                        for i in range(3, 0, -1):
-                            print(f"{i}...")
-                            time.sleep(1)
-                        print("Goodbye!")
-                        time.sleep(1)
+                        log.info("Exiting YouTube Uploader in:")
+                        countdown()
+                        log.info("Goodbye!")
+                        pause(1)
                         return  # Exit
                     else:
-                        print("Invalid input. Please enter 'y' or 'n'.")
+                        log.info("Invalid input. Please enter 'y' or 'n'.")
                 else:
-                    print("Invalid input. Please enter 'y' or 'n'.")
+                    log.info("Invalid input. Please enter 'y' or 'n'.")
 
-    except Exception as e:
-        print(f"An error occurred: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+    except Exception:
+        log.exception("An error occurred")
     finally:
         if chrome_driver:
             chrome_driver.quit_driver()
@@ -2,14 +2,61 @@
 Utility module initialization.
 
 This module provides configuration settings, web driver setup, and YouTube video uploading functionality.
+
+Selenium-backed classes are imported on first access (PEP 562), so importing
+the package stays cheap.
 """
 
-from .config import STUDIO_URL
-from .driver import ChromeDriver
-from .uploader import YouTubeUploader
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .config import (
+    FAST,
+    MAX_CONCURRENCY,
+    PROFILE_DIR,
+    STUDIO_URL,
+    STUDIO_URL_PREFIX,
+    UPLOAD_BACKEND,
+)
+from .files import VideoJob, clear_file_index, prefetch_file_index
+from .logger import flush_log, log
+
+if TYPE_CHECKING:
+    from .api_uploader import ApiUploader, load_credentials
+    from .driver import ChromeDriver
+    from .uploader import YouTubeUploader
+
+# Lazily imported attribute name -> submodule that defines it
+_LAZY_ATTRS: dict[str, str] = {
+    "ApiUploader": ".api_uploader",
+    "ChromeDriver": ".driver",
+    "YouTubeUploader": ".uploader",
+    "load_credentials": ".api_uploader",
+}
 
 __all__: list[str] = [
+    "ApiUploader",
     "ChromeDriver",
+    "FAST",
+    "MAX_CONCURRENCY",
+    "PROFILE_DIR",
     "STUDIO_URL",
+    "STUDIO_URL_PREFIX",
+    "UPLOAD_BACKEND",
+    "VideoJob",
     "YouTubeUploader",
+    "clear_file_index",
+    "flush_log",
+    "load_credentials",
+    "log",
+    "prefetch_file_index",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,228 @@
+"""
+YouTube Data API uploader.
+
+Uploads videos through the YouTube Data API v3 resumable upload endpoint
+instead of driving YouTube Studio in a browser.
+
+Requires the optional `google-api-python-client` and `google-auth-oauthlib`
+packages and an OAuth client secrets file for a desktop app.
+"""
+
+import os
+import re
+from itertools import cycle
+
+from utility.config import API_TOKEN_FILE, CLIENT_SECRETS_FILE, DESCRIPTION_FILE
+from utility.files import (
+    VideoJob,
+    find_keywords,
+    find_thumbnail,
+    read_keywords,
+    read_tags,
+)
+from utility.logger import log
+
+SCOPES: list[str] = ["https://www.googleapis.com/auth/youtube.upload"]
+
+# Upload in 8 MiB chunks so a failed request only resends one chunk
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Retries for 5xx, rate-limit and connection errors, with exponential backoff;
+# a retried chunk resumes the same upload instead of starting over
+UPLOAD_RETRIES = 5
+
+# Placeholders in the description template, filled in a single pass
+_PLACEHOLDER_RE = re.compile(r"KEYWORD|TITLE")
+
+
+def load_credentials():
+    """
+    Load saved OAuth credentials, refreshing or signing in as needed.
+
+    The first run opens a browser to sign in and saves the token for later runs.
+
+    Returns:
+        Credentials: Authorized user credentials.
+
+    Raises:
+        ImportError: If the Google API client packages are not installed.
+    """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    credentials = None
+    if os.path.exists(API_TOKEN_FILE):
+        credentials = Credentials.from_authorized_user_file(API_TOKEN_FILE, SCOPES)
+
+    if credentials and credentials.valid:
+        return credentials
+
+    if credentials and credentials.expired and credentials.refresh_token:
+        credentials.refresh(Request())
+    else:
+        flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRETS_FILE, SCOPES)
+        credentials = flow.run_local_server(port=0)
+
+    with open(API_TOKEN_FILE, "w", encoding="utf-8") as f:
+        f.write(credentials.to_json())
+    return credentials
+
+
+def fill_description(template: str, keywords: list[str], video_title: str) -> str:
+    """
+    Fill description placeholders.
+
+    Each "KEYWORD" takes the next keyword, cycling if there are more
+    placeholders than keywords, and each "TITLE" takes the video title.
+
+    Args:
+        template: Description with placeholders.
+        keywords: SEO keywords.
+        video_title: Title for the video.
+
+    Returns:
+        str: Filled description.
+    """
+    next_keyword = cycle(keywords or [""])
+    return _PLACEHOLDER_RE.sub(
+        lambda match: video_title if match.group() == "TITLE" else next(next_keyword),
+        template,
+    )
+
+
+class ApiUploader:
+    def __init__(self, credentials) -> None:
+        from googleapiclient.discovery import build
+
+        # Each uploader gets its own client, as the HTTP transport is not
+        # thread-safe
+        self.youtube = build(
+            "youtube", "v3", credentials=credentials, cache_discovery=False
+        )
+        self.description_template = ""
+        if DESCRIPTION_FILE:
+            with open(DESCRIPTION_FILE, "r", encoding="utf-8-sig") as f:
+                self.description_template = f.read()
+
+    def build_metadata(self, job: VideoJob) -> dict:
+        """
+        Build the snippet and status for a video from its sidecar files.
+
+        Args:
+            job: Video to upload.
+
+        Returns:
+            dict: Request body for videos.insert.
+        """
+        # Keywords and tags live on the first two lines of the same file
+        keywords_path = find_keywords(job.directory, job.title)
+
+        keywords = read_keywords(keywords_path) if keywords_path else []
+        description = fill_description(self.description_template, keywords, job.title)
+
+        tags: list[str] = []
+        if keywords_path:
+            tags = [tag.strip() for tag in read_tags(keywords_path).split(",")]
+            tags = [tag for tag in tags if tag]
+
+        # Ensure tags do not exceed YouTube's 500 character limit
+        while tags and len(",".join(tags)) > 460:
+            tags.pop()
+
+        return {
+            "snippet": {"title": job.title, "description": description, "tags": tags},
+            "status": {"privacyStatus": "private"},
+        }
+
+    def upload_file(self, job: VideoJob) -> str:
+        """
+        Upload the video file with a resumable upload.
+
+        Args:
+            job: Video to upload.
+
+        Returns:
+            str: ID of the uploaded video.
+        """
+        from googleapiclient.http import MediaFileUpload
+
+        log.info("Uploading video...")
+        request = self.youtube.videos().insert(
+            part="snippet,status",
+            body=self.build_metadata(job),
+            media_body=MediaFileUpload(job.path, chunksize=CHUNK_SIZE, resumable=True),
+        )
+        response = None
+        while response is None:
+            _, response = request.next_chunk(num_retries=UPLOAD_RETRIES)
+        log.info("Video uploaded!")
+        return response["id"]
+
+    def upload_thumbnail(self, video_id: str, thumbnail_path) -> None:
+        """
+        Set the video thumbnail if available.
+
+        Args:
+            video_id: ID of the uploaded video.
+            thumbnail_path: Path to thumbnail file or None.
+        """
+        from googleapiclient.http import MediaFileUpload
+
+        log.info("Uploading thumbnail...")
+        if not thumbnail_path:
+            log.error("Error: No matching thumbnail found!")
+            return
+
+        self.youtube.thumbnails().set(
+            videoId=video_id, media_body=MediaFileUpload(thumbnail_path)
+        ).execute(num_retries=UPLOAD_RETRIES)
+        log.info("Thumbnail uploaded!")
+
+    def start_upload(self, job: VideoJob, current_video, total_videos) -> bool:
+        """
+        Upload a video with its details and thumbnail.
+
+        Args:
+            job: Video to upload.
+            current_video: Index of current video.
+            total_videos: Total number of videos to upload.
+
+        Returns:
+            bool: True if the video was uploaded, False if an error occurred.
+        """
+        try:
+            log.info(f"\nVideo {current_video}/{total_videos}: {job.filename}")
+            video_id = self.upload_file(job)
+            self.upload_thumbnail(video_id, find_thumbnail(job.directory, job.title))
+            return True
+        except Exception:
+            log.exception(
+                "Error uploading video %s/%s - %s",
+                current_video,
+                total_videos,
+                job.filename,
+            )
+        return False
+
+    def finalize_upload(self, current_video, total_videos) -> None:
+        """
+        Report a finished upload. The API needs no extra processing wait.
+
+        Args:
+            current_video: Index of current video.
+            total_videos: Total number of videos to upload.
+        """
+        log.info(f"\nVideo {current_video}/{total_videos} uploaded!")
+
+    def upload_video(self, job: VideoJob, current_video, total_videos) -> None:
+        """
+        Handle video upload process.
+
+        Args:
+            job: Video to upload.
+            current_video: Index of current video.
+            total_videos: Total number of videos to upload.
+        """
+        if self.start_upload(job, current_video, total_videos):
+            self.finalize_upload(current_video, total_videos)
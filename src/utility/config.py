@@ -11,5 +11,33 @@ import dotenv
 # Load environment variables
 dotenv.load_dotenv()
 
-# Get the studio URL from environment variable
-STUDIO_URL: str | None = os.getenv(key="YOUTUBE_STUDIO_URL")
+# How videos are uploaded: "studio" drives YouTube Studio in Chrome, "api"
+# uses the YouTube Data API
+UPLOAD_BACKEND: str = os.getenv("MR_MYTER_UPLOAD_BACKEND", "studio").lower()
+
+# Get the studio URL from environment variable (required for the Studio backend)
+_studio_url: str | None = os.getenv(key="YOUTUBE_STUDIO_URL")
+if _studio_url is None and UPLOAD_BACKEND != "api":
+    raise RuntimeError("YOUTUBE_STUDIO_URL is not set, see .example.env")
+STUDIO_URL: str = _studio_url or ""
+
+# Shortened studio URL for status messages
+STUDIO_URL_PREFIX: str = STUDIO_URL[:38]
+
+# Number of videos being uploaded at the same time
+MAX_CONCURRENCY: int = max(1, int(os.getenv("MR_MYTER_MAX_CONCURRENCY", "1")))
+
+# Folder of signed-in Chrome profiles (worker-1, worker-2, ...) for headless
+# upload workers. When unset, extra workers use tabs in the debugging Chrome.
+PROFILE_DIR: str | None = os.getenv("MR_MYTER_PROFILE_DIR")
+
+# OAuth client secrets and saved token for the "api" backend
+CLIENT_SECRETS_FILE: str = os.getenv("MR_MYTER_CLIENT_SECRETS", "client_secrets.json")
+API_TOKEN_FILE: str = os.getenv("MR_MYTER_API_TOKEN", "token.json")
+
+# Description template with KEYWORD/TITLE placeholders for the "api" backend,
+# which cannot read the Studio upload defaults
+DESCRIPTION_FILE: str | None = os.getenv("MR_MYTER_DESCRIPTION_FILE")
+
+# Skip cosmetic pauses and countdowns, e.g. for unattended runs
+FAST: bool = os.getenv("MR_MYTER_FAST") == "1"
@@ -4,21 +4,57 @@ Chrome WebDriver management for YouTube video uploading.
 Handles Chrome initialization and WebDriver setup.
 """
 
+from __future__ import annotations
+
+import http.client
+import os
 import platform
 import subprocess
+import time
+from typing import TYPE_CHECKING
+
+from .config import PROFILE_DIR, STUDIO_URL, STUDIO_URL_PREFIX
+from .logger import log
+
+# Selenium and webdriver-manager are imported where used to keep startup fast
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.webdriver import WebDriver
+
+
+# Where webdriver-manager keeps the chromedrivers it has downloaded
+WDM_DRIVERS_DIR = os.path.join(
+    os.path.expanduser("~"), ".wdm", "drivers", "chromedriver"
+)
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
 
-from .config import STUDIO_URL
+def find_cached_chromedriver() -> str | None:
+    """
+    Find the most recently downloaded chromedriver in webdriver-manager's cache.
+
+    Returns:
+        str or None: Path to the chromedriver executable, or None if none found.
+    """
+    names = ("chromedriver.exe", "chromedriver")
+    newest, newest_mtime = None, 0.0
+    for root, _, files in os.walk(WDM_DRIVERS_DIR):
+        for name in names:
+            if name in files:
+                path = os.path.join(root, name)
+                mtime = os.path.getmtime(path)
+                if mtime > newest_mtime:
+                    newest, newest_mtime = path, mtime
+    return newest
 
 
 class ChromeDriver:
+    # Resolved chromedriver path, shared so webdriver-manager only runs once
+    _driver_path: str | None = None
+
     def __init__(self):
         self.driver = None
+        self.worker_drivers: list[WebDriver] = []
 
     def start_chrome_debugger(self) -> None:
         """
@@ -29,8 +65,8 @@ class ChromeDriver:
         """
         # Default Chrome paths for different operating systems
         chrome_paths = {
-            "win32": r'"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"',
-            "win64": r'"C:\Program Files\Google\Chrome\Application\chrome.exe"',
+            "win32": r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+            "win64": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
             "linux": "google-chrome",
             "darwin": "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
         }
@@ -50,19 +86,126 @@ class ChromeDriver:
         else:
             raise Exception(f"Unsupported operating system: {os_type}")
 
-        # Construct the command with debugging flag
-        command = f"{chrome_path} --remote-debugging-port=9222"
+        # Construct the command with debugging flag, turning off background
+        # work Studio does not need and keeping background tabs at full speed
+        command = [
+            chrome_path,
+            "--remote-debugging-port=9222",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking",
+            "--disable-sync",
+            "--disable-translate",
+            "--disable-default-apps",
+            "--disable-renderer-backgrounding",
+            "--disable-background-timer-throttling",
+            "--mute-audio",
+        ]
 
         try:
-            # Redirect stderr to suppress D-Bus errors
+            # Redirect output to suppress D-Bus errors, and detach on Windows
+            # so Chrome is not tied to this console
             subprocess.Popen(
-                command, 
-                shell=True, 
-                stderr=subprocess.DEVNULL
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                creationflags=(
+                    subprocess.DETACHED_PROCESS if os_type == "windows" else 0
+                ),
             )
-            print("Starting Chrome with remote debugging...")
+            log.info("Starting Chrome with remote debugging...")
         except Exception as e:
-            print(f"Error starting Chrome: {str(e)}")
+            log.error(f"Error starting Chrome: {str(e)}")
+            return
+
+        if not self._wait_for_debugger():
+            log.warning("Chrome debugger did not respond in time")
+
+    @staticmethod
+    def _wait_for_debugger(port: int = 9222, timeout: float = 10.0) -> bool:
+        """
+        Poll Chrome's debugger endpoint until it answers.
+
+        Args:
+            port: Remote debugging port.
+            timeout: Maximum wait time in seconds.
+
+        Returns:
+            bool: True if the debugger responded, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=0.2)
+            try:
+                connection.request("GET", "/json/version")
+                if connection.getresponse().status == 200:
+                    return True
+            except (OSError, http.client.HTTPException):
+                pass
+            finally:
+                connection.close()
+            time.sleep(0.05)
+        return False
+
+    @classmethod
+    def get_service(cls, refresh: bool = False) -> Service:
+        """
+        Build a chromedriver Service, resolving the driver path only once.
+
+        A chromedriver already downloaded by webdriver-manager is used as is,
+        skipping its version lookup over the network.
+
+        Args:
+            refresh: Ask webdriver-manager for a matching driver even if one
+                was found before, e.g. after Chrome has been updated.
+
+        Returns:
+            Service: Service for the cached chromedriver executable.
+        """
+        from selenium.webdriver.chrome.service import Service
+
+        if cls._driver_path is None and not refresh:
+            cls._driver_path = find_cached_chromedriver()
+        if refresh or cls._driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            cls._driver_path = ChromeDriverManager().install()
+        return Service(cls._driver_path)
+
+    @staticmethod
+    def build_options(headless: bool = False) -> Options:
+        """
+        Build Chrome options shared by every WebDriver session.
+
+        Page loads return at DOMContentLoaded, since every step waits for the
+        elements it needs anyway. Headless sessions also skip images, GPU and
+        notifications, which Studio does not need for uploading.
+
+        Args:
+            headless: Whether the options launch a new headless Chrome.
+
+        Returns:
+            Options: Configured Chrome options.
+        """
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.page_load_strategy = "eager"
+
+        if headless:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option(
+                "prefs",
+                {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2,
+                },
+            )
+        return chrome_options
 
     def setup_driver(self) -> WebDriver | None:
         """
@@ -74,23 +217,102 @@ class ChromeDriver:
         Raises:
             Exception: If WebDriver initialization or navigation fails.
         """
-        print("Setting up WebDriver...")
-        chrome_options = Options()
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException
+
+        log.info("Setting up WebDriver...")
+        chrome_options = self.build_options()
         chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
 
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            print("WebDriver initialized successfully")
+            try:
+                service = self.get_service()
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            except SessionNotCreatedException:
+                # The cached chromedriver no longer matches the installed Chrome
+                log.warning("Chromedriver is out of date, fetching a new one...")
+                service = self.get_service(refresh=True)
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            log.info("WebDriver initialized successfully")
 
-            print(f"Navigating to {STUDIO_URL[:38]}...")
+            log.info(f"Navigating to {STUDIO_URL_PREFIX}...")
             self.driver.get(STUDIO_URL)
 
             return self.driver
         except Exception as e:
-            print(f"Error initializing WebDriver: {str(e)}")
+            log.error(f"Error initializing WebDriver: {str(e)}")
+            return None
+
+    def open_tab_driver(self) -> WebDriver | None:
+        """
+        Attach an extra WebDriver session pinned to a new Chrome tab.
+
+        Each session keeps its own current window, so sessions can be driven
+        from separate threads without switching tabs under each other.
+
+        Returns:
+            WebDriver or None: Session on the new tab or None if error occurs.
+        """
+        from selenium import webdriver
+
+        chrome_options = self.build_options()
+        chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
+
+        try:
+            service = self.get_service()
+            tab_driver = webdriver.Chrome(service=service, options=chrome_options)
+            tab_driver.switch_to.new_window("tab")
+            tab_driver.get(STUDIO_URL)
+            self.worker_drivers.append(tab_driver)
+            return tab_driver
+        except Exception as e:
+            log.error(f"Error opening new tab: {str(e)}")
+            return None
+
+    def open_headless_driver(self, user_data_dir: str) -> WebDriver | None:
+        """
+        Launch a separate headless Chrome on a signed-in profile.
+
+        Args:
+            user_data_dir: Chrome profile folder, signed in to YouTube beforehand.
+
+        Returns:
+            WebDriver or None: Headless WebDriver or None if error occurs.
+        """
+        from selenium import webdriver
+
+        chrome_options = self.build_options(headless=True)
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+        try:
+            service = self.get_service()
+            headless_driver = webdriver.Chrome(service=service, options=chrome_options)
+            headless_driver.get(STUDIO_URL)
+            self.worker_drivers.append(headless_driver)
+            return headless_driver
+        except Exception as e:
+            log.error(f"Error starting headless Chrome: {str(e)}")
             return None
 
+    def open_worker_driver(self, worker: int) -> WebDriver | None:
+        """
+        Open a WebDriver for an extra upload worker.
+
+        Uses a headless Chrome on `worker-<n>` under MR_MYTER_PROFILE_DIR when
+        set, otherwise a new tab in the debugging Chrome.
+
+        Args:
+            worker: Worker number, starting at 1.
+
+        Returns:
+            WebDriver or None: Worker's WebDriver or None if error occurs.
+        """
+        if PROFILE_DIR:
+            return self.open_headless_driver(
+                os.path.join(PROFILE_DIR, f"worker-{worker}")
+            )
+        return self.open_tab_driver()
+
     def get_driver(self) -> WebDriver | None:
         """
         Get current WebDriver instance.
@@ -100,10 +322,42 @@ class ChromeDriver:
         """
         return self.driver
 
+    def is_connected(self) -> bool:
+        """
+        Check that the WebDriver and the debugging Chrome behind it still respond.
+
+        Returns:
+            bool: True if both answer, False if either is gone.
+        """
+        if not self.driver:
+            return False
+        return self.driver.service.is_connectable() and self._wait_for_debugger(
+            timeout=0.5
+        )
+
     def quit_driver(self) -> None:
         """
-        Quit WebDriver instance if it exists.
+        Quit WebDriver instance and any worker drivers if they exist.
+
+        Sessions whose browser has already gone away are dropped without error.
         """
+        for worker_driver in self.worker_drivers:
+            self._quit_quietly(worker_driver)
+        self.worker_drivers.clear()
+
         if self.driver:
-            self.driver.quit()
+            self._quit_quietly(self.driver)
             self.driver = None
+
+    @staticmethod
+    def _quit_quietly(driver: WebDriver) -> None:
+        """
+        Quit a WebDriver session, logging instead of raising if it fails.
+
+        Args:
+            driver: Session to quit.
+        """
+        try:
+            driver.quit()
+        except Exception as e:
+            log.warning(f"Error closing WebDriver: {str(e)}")
@@ -0,0 +1,178 @@
+"""
+Video and sidecar file discovery.
+
+Finds the thumbnail, keywords and tags files that sit next to each video.
+"""
+
+import functools
+import itertools
+import os
+import threading
+from typing import NamedTuple
+
+# Sidecar extensions, in order of preference
+_THUMB_EXTS: tuple[str, ...] = (".jpg", ".jpeg", ".png", ".gif")
+_TEXT_EXTS: tuple[str, ...] = (".txt", ".md", ".json")
+
+
+class VideoJob(NamedTuple):
+    """
+    Video to upload, with its path parts resolved once.
+
+    Attributes:
+        path: Absolute path to the video file.
+        filename: File name with extension.
+        title: File name without extension, used as the video title.
+        directory: Folder containing the video and its sidecar files.
+    """
+
+    path: str
+    filename: str
+    title: str
+    directory: str
+
+    @classmethod
+    def from_entry(
+        cls, entry: os.DirEntry, directory: str, title: str | None = None
+    ) -> "VideoJob":
+        """
+        Build a job from a directory entry found while scanning a folder.
+
+        Args:
+            entry: Directory entry of the video file.
+            directory: Absolute path of the scanned folder.
+            title: File name without extension, if the caller already split it.
+
+        Returns:
+            VideoJob: Job for the video.
+        """
+        if title is None:
+            title = os.path.splitext(entry.name)[0]
+        return cls(
+            path=entry.path,
+            filename=entry.name,
+            title=title,
+            directory=directory,
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _index_dir(video_dir: str) -> dict[str, str]:
+    """
+    Map lowercased file names in a directory to their full paths.
+
+    Args:
+        video_dir: Directory to index.
+
+    Returns:
+        dict: Lowercased file name to file path.
+    """
+    with os.scandir(video_dir) as entries:
+        return {
+            entry.name.lower(): entry.path
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+        }
+
+
+def clear_file_index() -> None:
+    """
+    Forget cached directory listings so new files are picked up.
+    """
+    _index_dir.cache_clear()
+
+
+def prefetch_file_index(video_dir: str) -> None:
+    """
+    Read a folder's sidecar index in a background thread.
+
+    The first upload then finds its thumbnail and keywords in the cache
+    instead of reading the directory itself.
+
+    Args:
+        video_dir: Directory to index.
+    """
+    threading.Thread(target=_index_dir, args=(video_dir,), daemon=True).start()
+
+
+def _find_sidecar(video_dir: str, video_name: str, exts) -> str | None:
+    """
+    Find the first file named after a video with one of the given extensions.
+
+    Uses the cached directory index, so no per-extension stat calls are made.
+
+    Args:
+        video_dir: Folder containing the video.
+        video_name: Video file name without extension.
+        exts: Extensions to try, in order of preference.
+
+    Returns:
+        str or None: Path to the matching file if found, None otherwise.
+    """
+    video_name = video_name.lower()
+    dir_index = _index_dir(video_dir)
+
+    for ext in exts:
+        sidecar_path = dir_index.get(video_name + ext)
+        if sidecar_path:
+            return sidecar_path
+    return None
+
+
+def find_thumbnail(video_dir: str, video_name: str) -> str | None:
+    """
+    Find matching thumbnail for a video file.
+
+    Args:
+        video_dir: Folder containing the video.
+        video_name: Video file name without extension.
+
+    Returns:
+        str or None: Path to thumbnail if found, None otherwise.
+    """
+    return _find_sidecar(video_dir, video_name, _THUMB_EXTS)
+
+
+def find_keywords(video_dir: str, video_name: str) -> str | None:
+    """
+    Find matching keywords file for a video file.
+
+    The same file holds the keywords on its first line and the tags on its
+    second line.
+
+    Args:
+        video_dir: Folder containing the video.
+        video_name: Video file name without extension.
+
+    Returns:
+        str or None: Path to keywords file if found, None otherwise.
+    """
+    return _find_sidecar(video_dir, video_name, _TEXT_EXTS)
+
+
+def read_keywords(keywords_path: str) -> list[str]:
+    """
+    Read the comma-separated SEO keywords from the first line of a file.
+
+    Args:
+        keywords_path: Path to the keywords file.
+
+    Returns:
+        list: Keywords with surrounding whitespace removed.
+    """
+    with open(keywords_path, "r", encoding="utf-8-sig", buffering=8192) as f:
+        return [keyword.strip() for keyword in f.readline().split(",")]
+
+
+def read_tags(tags_path: str) -> str:
+    """
+    Read the comma-separated tags from the second line of a file.
+
+    Args:
+        tags_path: Path to the tags file.
+
+    Returns:
+        str: Tags line, or an empty string if the file has no second line.
+    """
+    with open(tags_path, "r", encoding="utf-8-sig", buffering=8192) as f:
+        return next(itertools.islice(f, 1, 2), "")
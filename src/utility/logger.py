@@ -0,0 +1,35 @@
+"""
+Logging for Mr-Myter.
+
+Sends status messages to stdout, batching writes in fast mode.
+"""
+
+import logging
+import logging.handlers
+import sys
+
+from .config import FAST
+
+log = logging.getLogger("mr_myter")
+log.setLevel(logging.INFO)
+log.propagate = False
+
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+# In fast mode messages are buffered and written in batches; errors flush at once
+_handler: logging.Handler = (
+    logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=_stream_handler
+    )
+    if FAST
+    else _stream_handler
+)
+log.addHandler(_handler)
+
+
+def flush_log() -> None:
+    """
+    Write out any buffered log messages, e.g. before prompting the user.
+    """
+    _handler.flush()
@@ -4,12 +4,14 @@ YouTube Video Uploader.
 Manages YouTube video uploading process and interface interactions.
 """
 
-import os
 import time
-import traceback
+from urllib.parse import urlsplit
 
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
     TimeoutException,
 )
 from selenium.webdriver.common.by import By
@@ -18,13 +20,216 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from utility.config import STUDIO_URL
+from utility.files import (
+    VideoJob,
+    find_keywords,
+    find_thumbnail,
+    read_keywords,
+    read_tags,
+)
+from utility.logger import log
+
+# Scheme and host of Studio, to tell whether a tab already has it loaded
+STUDIO_ORIGIN = "{0.scheme}://{0.netloc}/".format(urlsplit(STUDIO_URL))
+
+# Element locators, built once and shared by every lookup
+LOC_FILE_INPUT = (By.CSS_SELECTOR, 'input[type="file"]')
+LOC_NEXT_BUTTON = (By.CSS_SELECTOR, "#next-button")
+LOC_TITLE_TEXTBOX = (
+    By.CSS_SELECTOR,
+    "ytcp-social-suggestions-textbox[id='title-textarea'] div[id='textbox']",
+)
+LOC_DESCRIPTION_TEXTBOX = (
+    By.CSS_SELECTOR,
+    "ytcp-social-suggestions-textbox[id='description-textarea'] div[id='textbox']",
+)
+LOC_UPLOAD_DIALOG = (By.CSS_SELECTOR, "ytcp-uploads-dialog")
+LOC_UPLOAD_DIALOG_BOX = (By.CSS_SELECTOR, "ytcp-uploads-dialog tp-yt-paper-dialog")
+LOC_UPLOAD_DIALOG_CLOSE = (By.CSS_SELECTOR, "ytcp-uploads-dialog #close-button")
+LOC_THUMBNAIL_INPUT = (
+    By.CSS_SELECTOR,
+    'input[type="file"][accept="image/jpeg,image/png"]',
+)
+LOC_THUMBNAIL_PREVIEW = (
+    By.CSS_SELECTOR,
+    "ytcp-thumbnails-compact-editor-uploaded-thumbnail img",
+)
+LOC_MORE_OPTIONS_TOGGLE = (By.CSS_SELECTOR, "ytcp-button#toggle-button")
+LOC_DEFAULT_TAG_TEXT = (By.CSS_SELECTOR, "ytcp-chip[id='chip-0'] #chip-text")
+LOC_DEFAULT_TAG_DELETE = (By.CSS_SELECTOR, "ytcp-chip[id='chip-0'] #delete-icon")
+LOC_TAGS_INPUT = (
+    By.CSS_SELECTOR,
+    "input.text-input.style-scope.ytcp-chip-bar[aria-label='Tags']",
+)
+
+# Errors click_when_ready retries on until its timeout runs out
+_CLICK_RETRY_EXCEPTIONS = (
+    NoSuchElementException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
+# Centres an element in view and clicks it, for clicks an overlay intercepts
+_SCROLL_AND_CLICK_JS = """
+arguments[0].scrollIntoView({ block: "center" });
+arguments[0].click();
+"""
+
+# Sets the title and fills the description placeholders in one round-trip.
+# Each "KEYWORD" takes the next keyword, cycling if needed, and "TITLE" takes
+# the title. Returns whether the title box reads back as the title after
+# Studio's input handlers ran, and the new description text.
+_SET_DETAILS_JS = """
+const [root, titleSelector, descriptionSelector, title, keywords] = arguments;
+const scope = root || document;
+const result = { title: false, description: "" };
+
+const titleBox = scope.querySelector(titleSelector);
+if (titleBox) {
+    titleBox.textContent = title;
+    titleBox.dispatchEvent(new Event("input", { bubbles: true }));
+    result.title = titleBox.innerText.trim() === title.trim();
+}
+
+const descriptionBox = scope.querySelector(descriptionSelector);
+if (descriptionBox) {
+    let next = 0;
+    const text = descriptionBox.innerText.replace(/KEYWORD|TITLE/g, (placeholder) =>
+        placeholder === "TITLE" ? title
+            : keywords.length ? keywords[next++ % keywords.length] : placeholder
+    );
+    descriptionBox.innerText = text;
+    descriptionBox.dispatchEvent(new Event("input", { bubbles: true }));
+    result.description = text;
+}
+return result;
+"""
+
+# Sets the tags input and fires the events Studio listens for, all at once
+_SET_TAGS_JS = """
+const [input, tags] = arguments;
+input.value = tags;
+input.dispatchEvent(new Event("input"));
+input.dispatchEvent(new Event("change"));
+input.dispatchEvent(new KeyboardEvent("keydown", { key: "Enter" }));
+input.dispatchEvent(new KeyboardEvent("keyup", { key: "Enter" }));
+"""
+
+# Clicks "Show more" if the extra options are collapsed. Returns "clicked",
+# "expanded" or "missing".
+_EXPAND_MORE_OPTIONS_JS = """
+const button = document.querySelector(arguments[0]);
+if (!button) return "missing";
+const label = (button.getAttribute("aria-label") || "") + " " + (
+    button.querySelector(".ytcp-button-shape-impl__button-text-content")
+        ?.textContent || ""
+);
+if (label.includes("Show more")) {
+    button.click();
+    return "clicked";
+}
+return "expanded";
+"""
+
+# True when Studio is loaded and no upload dialog from a previous video is
+# still showing, so the page can be reused without a reload
+_STUDIO_READY_JS = """
+const shown = (el) => !!el && el.getClientRects().length > 0;
+return !!document.querySelector("#create-icon")
+    && !shown(document.querySelector("ytcp-uploads-dialog tp-yt-paper-dialog"));
+"""
+
+# Clicks "Create" then "Upload videos" in one round-trip. Waits for each element
+# to be displayed with a MutationObserver and reports false if they do not show
+# up in time. "Create" is clicked again while the menu stays closed, as an early
+# click on an eagerly loaded page can land before Studio has wired it up.
+_OPEN_UPLOAD_DIALOG_JS = """
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + arguments[0];
+const shown = (el) => (el && el.getClientRects().length > 0 ? el : null);
+let retryTimer = null;
+
+function waitFor(find, then) {
+    const found = find();
+    if (found) {
+        then(found);
+        return;
+    }
+    const observer = new MutationObserver(() => {
+        const el = find();
+        if (el) {
+            observer.disconnect();
+            clearTimeout(timer);
+            then(el);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        clearInterval(retryTimer);
+        done(false);
+    }, Math.max(0, deadline - Date.now()));
+    observer.observe(document, { childList: true, subtree: true, attributes: true });
+}
+
+const findUploadOption = () =>
+    shown(document.querySelector("tp-yt-paper-item[test-id='upload-beta']"))
+    || [...document.querySelectorAll("tp-yt-paper-item[role='menuitem']")]
+        .find((item) => shown(item) && item.textContent.includes("Upload videos"));
+
+waitFor(
+    () => shown(document.querySelector("#create-icon")),
+    (createButton) => {
+        createButton.click();
+        retryTimer = setInterval(() => {
+            if (!findUploadOption()) createButton.click();
+        }, 1000);
+        waitFor(findUploadOption, (uploadOption) => {
+            clearInterval(retryTimer);
+            uploadOption.click();
+            done(true);
+        });
+    },
+);
+"""
 
 
 class YouTubeUploader:
     def __init__(self, driver) -> None:
         self.driver = driver
+        self._waits: dict[tuple, WebDriverWait] = {}
+        # Upload dialog of the current video, cached once its fields are up
+        self._dialog_root = None
+
+    def wait(
+        self, timeout, poll_frequency=0.1, ignored_exceptions=None
+    ) -> WebDriverWait:
+        """
+        Get an explicit wait that polls faster than Selenium's 500ms default.
+
+        Waits are cached per timeout, poll frequency and ignored exceptions and
+        reused across calls.
+
+        Args:
+            timeout: Maximum wait time in seconds.
+            poll_frequency: Seconds between condition checks.
+            ignored_exceptions: Tuple of exceptions to retry on, or None.
+
+        Returns:
+            WebDriverWait: Wait bound to this uploader's driver.
+        """
+        key = (timeout, poll_frequency, ignored_exceptions)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=poll_frequency,
+                ignored_exceptions=ignored_exceptions,
+            )
+            self._waits[key] = wait
+        return wait
 
-    def safe_find_element(self, by, value, timeout=10):
+    def safe_find_element(self, by, value, timeout=10, poll_frequency=0.1):
         """
         Safely locate an element on the page.
 
@@ -32,117 +237,135 @@ class YouTubeUploader:
             by: Locator method.
             value: Locator value.
             timeout: Maximum wait time in seconds.
+            poll_frequency: Seconds between lookups.
 
         Returns:
             WebElement or None: Found element or None if not found.
         """
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return self.wait(timeout, poll_frequency).until(
                 EC.presence_of_element_located((by, value))
             )
         except TimeoutException:
-            print(f"Element not found: {by}={value}")
+            log.warning(f"Element not found: {by}={value}")
             return None
 
-    def safe_click(self, element) -> None:
+    def _find_now(self, by, value):
         """
-        Safely click an element, using JavaScript if needed.
+        Look up an optional element without waiting for it to appear.
 
         Args:
-            element: Element to click.
+            by: Locator method.
+            value: Locator value.
 
-        Raises:
-            Exceptions not caught by ElementClickInterceptedException.
+        Returns:
+            WebElement or None: First matching element or None if absent.
         """
-        try:
-            element.click()
-        except ElementClickInterceptedException:
-            self.driver.execute_script("arguments[0].click();", element)
+        elements = self.driver.find_elements(by, value)
+        return elements[0] if elements else None
 
-    @staticmethod
-    def find_thumbnail(video_path: str) -> str | None:
+    def _find_in_dialog(self, by, value):
         """
-        Find matching thumbnail for a video file.
+        Look up an element under the cached upload dialog.
+
+        Falls back to a waiting page-wide lookup if the dialog is not cached
+        or the element has not been rendered yet.
 
         Args:
-            video_path: Path to video file.
+            by: Locator method.
+            value: Locator value.
 
         Returns:
-            str or None: Path to thumbnail if found, None otherwise.
+            WebElement or None: Found element or None if not found.
         """
-        video_dir = os.path.dirname(video_path)
-        video_name = os.path.splitext(os.path.basename(video_path))[0]
-
-        for ext in [".jpg", ".jpeg", ".png", ".gif"]:
-            thumbnail_path = os.path.join(video_dir, video_name + ext)
-            if os.path.exists(thumbnail_path):
-                return thumbnail_path
-        return None
+        if self._dialog_root:
+            try:
+                elements = self._dialog_root.find_elements(by, value)
+            except StaleElementReferenceException:
+                self._dialog_root = None
+            else:
+                if elements:
+                    return elements[0]
+        return self.safe_find_element(by, value)
 
-    @staticmethod
-    def find_keywords(video_path: str) -> str | None:
+    def _wait_clickable(self, by, value, timeout=20):
         """
-        Find matching thumbnail for a video file.
+        Wait until an element is visible and enabled.
 
         Args:
-            video_path: Path to video file.
+            by: Locator method.
+            value: Locator value.
+            timeout: Maximum wait time in seconds.
 
         Returns:
-            str or None: Path to thumbnail if found, None otherwise.
-        """
-        video_dir = os.path.dirname(video_path)
-        video_name = os.path.splitext(os.path.basename(video_path))[0]
+            WebElement: The clickable element.
 
-        for ext in [".txt", ".md", ".json"]:
-            keywords_path = os.path.join(video_dir, video_name + ext)
-            if os.path.exists(keywords_path):
-                return keywords_path
-        return None
+        Raises:
+            TimeoutException: If the element is not clickable within timeout.
+        """
+        return self.wait(timeout).until(EC.element_to_be_clickable((by, value)))
 
-    @staticmethod
-    def find_tags(video_path: str) -> str | None:
+    def click_when_ready(self, by, value, timeout=20, native_attempts=3) -> bool:
         """
-        Find matching tags for a video file.
+        Click an element as soon as it is displayed and accepts the click.
+
+        Stale elements are looked up again on every poll. A click that keeps
+        being intercepted is finally made with JavaScript after scrolling the
+        element into view.
 
         Args:
-            video_path: Path to video file.
+            by: Locator method.
+            value: Locator value.
+            timeout: Maximum wait time in seconds.
+            native_attempts: Intercepted clicks to retry before using JavaScript.
 
         Returns:
-            str or None: Path to tags file if found, None otherwise.
+            bool: True if the element was clicked, False on timeout.
         """
-        video_dir = os.path.dirname(video_path)
-        video_name = os.path.splitext(os.path.basename(video_path))[0]
+        intercepted = 0
+
+        def click(driver) -> bool:
+            nonlocal intercepted
+            element = driver.find_element(by, value)
+            if not element.is_displayed():
+                return False
+            try:
+                element.click()
+            except (ElementClickInterceptedException, ElementNotInteractableException):
+                intercepted += 1
+                if intercepted < native_attempts:
+                    raise
+                driver.execute_script(_SCROLL_AND_CLICK_JS, element)
+            return True
 
-        for ext in [".txt", ".md", ".json"]:
-            tags_path = os.path.join(video_dir, video_name + ext)
-            if os.path.exists(tags_path):
-                return tags_path
-        return None
+        try:
+            return self.wait(timeout, ignored_exceptions=_CLICK_RETRY_EXCEPTIONS).until(
+                click
+            )
+        except TimeoutException:
+            log.warning(f"Element not clickable: {by}={value}")
+            return False
 
     def navigate_to_upload_page(self) -> None:
         """
         Navigate to YouTube Studio upload page.
 
         Raises:
-            TimeoutException: If page elements are not clickable.
+            TimeoutException: If page elements do not appear.
         """
-        print("\nNavigating to upload page...")
+        log.info("\nNavigating to upload page...")
+        # Reuse the loaded Studio page and only reload it as a fallback
+        if (
+            self.driver.current_url.startswith(STUDIO_ORIGIN)
+            and self.driver.execute_script(_STUDIO_READY_JS)
+            and self.driver.execute_async_script(_OPEN_UPLOAD_DIALOG_JS, 3000)
+        ):
+            return
+
         self.driver.get(STUDIO_URL)
-        create_button = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "#create-icon"))
-        )
-        self.safe_click(create_button)
-
-        upload_option = WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    "//tp-yt-paper-item[@role='menuitem']//yt-formatted-string[contains(text(), 'Upload videos')]",
-                )
-            )
-        )
-        self.safe_click(upload_option)
-        time.sleep(3)
+        # Timeout is kept below Selenium's default 30s script timeout
+        if not self.driver.execute_async_script(_OPEN_UPLOAD_DIALOG_JS, 20000):
+            raise TimeoutException("Create button or upload option not found")
 
     def select_video_file(self, video_path) -> None:
         """
@@ -154,12 +377,12 @@ class YouTubeUploader:
         Raises:
             TimeoutException: If file input is not present.
         """
-        print("Selecting video to upload...")
-        file_input = WebDriverWait(self.driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="file"]'))
+        log.info("Selecting video to upload...")
+        file_input = self.wait(20).until(
+            EC.presence_of_element_located(LOC_FILE_INPUT)
         )
         file_input.send_keys(video_path)
-        print("Video selected!")
+        log.info("Video selected!")
 
     def wait_for_input_fields(self) -> None:
         """
@@ -169,42 +392,22 @@ class YouTubeUploader:
             Exception: If input fields don't appear within timeout.
         """
         next_button = self.safe_find_element(
-            By.CSS_SELECTOR, "#next-button", timeout=300
+            *LOC_NEXT_BUTTON, timeout=300, poll_frequency=0.5
         )
-        time.sleep(3)
         if not next_button:
             raise Exception("Input fields not found")
-
-    def set_video_title(self, video_title) -> None:
-        """
-        Set title of uploaded video.
-
-        Args:
-            video_title: Title for the video.
-        """
-        print("Renaming video title...")
-        time.sleep(3)
-        title_input = self.safe_find_element(
-            By.CSS_SELECTOR,
-            "ytcp-social-suggestions-textbox[id='title-textarea'] div[id='textbox']",
-        )
-        if title_input:
-            title_input.clear()
-            title_input.send_keys(video_title)
-            print("Video renamed!")
-            time.sleep(3)
-        else:
-            print("Failed to rename video title")
+        # The dialog is up, so later field lookups can be scoped to it
+        self._dialog_root = self._find_now(*LOC_UPLOAD_DIALOG)
 
     def focus_upload_dialog(self) -> None:
         """
         Simulates a scroll on the upload dialog to focus and reveal more options.
         """
-        upload_dialog = self.safe_find_element(By.CSS_SELECTOR, "ytcp-uploads-dialog")
+        upload_dialog = self._dialog_root or self.safe_find_element(*LOC_UPLOAD_DIALOG)
         if upload_dialog:
             self.driver.execute_script("arguments[0].scrollTop += 500;", upload_dialog)
         else:
-            print("Error: Upload dialog not found!")
+            log.error("Error: Upload dialog not found!")
 
     def upload_thumbnail(self, thumbnail_path) -> None:
         """
@@ -213,118 +416,131 @@ class YouTubeUploader:
         Args:
             thumbnail_path: Path to thumbnail file or None.
         """
-        print("Uploading thumbnail...")
+        log.info("Uploading thumbnail...")
         if thumbnail_path:
-            thumbnail_input = self.safe_find_element(
-                By.CSS_SELECTOR,
-                'input[type="file"][accept="image/jpeg,image/png"]',
-            )
+            thumbnail_input = self._find_in_dialog(*LOC_THUMBNAIL_INPUT)
             if thumbnail_input:
                 thumbnail_input.send_keys(thumbnail_path)
-                time.sleep(3)
-                print("Thumbnail uploaded!")
-                time.sleep(3)
+                # Studio shows a preview once the thumbnail has been accepted.
+                # The input already has the file, so do not hold the upload
+                # longer than the old fixed pause if the preview is slow
+                try:
+                    self.wait(6).until(
+                        EC.presence_of_element_located(LOC_THUMBNAIL_PREVIEW)
+                    )
+                    log.info("Thumbnail uploaded!")
+                except TimeoutException:
+                    log.info("Thumbnail sent, preview not shown yet")
             else:
-                print("Error: Thumbnail input not found!")
+                log.error("Error: Thumbnail input not found!")
         else:
-            print("Error: No matching thumbnail found!")
+            log.error("Error: No matching thumbnail found!")
 
-    def set_video_description(self, keywords_path, video_title) -> None:
+    def set_video_details(self, video_title, keywords_path) -> None:
         """
-        Set description of uploaded video.
+        Set title and description of uploaded video in a single script call.
 
         Args:
-            keywords_path (_type_): Path to the file that contains keywords
-            video_title (_type_): Title for the video
+            video_title: Title for the video.
+            keywords_path: Path to the file that contains keywords, or None.
         """
-        print("Updating video description...")
+        log.info("Renaming video title and updating description...")
         # Read first line of keywords from file and create list of keywords
-        with open(keywords_path, "r") as f:
-            seo_keywords = [keyword.strip() for keyword in f.readline().split(",")]
+        seo_keywords = read_keywords(keywords_path) if keywords_path else []
+        if not seo_keywords:
+            log.error("Error: No matching keywords file found!")
 
-        # Find video description input Element
-        description_input = self.safe_find_element(
-            By.CSS_SELECTOR,
-            "ytcp-social-suggestions-textbox[id='description-textarea'] div[id='textbox']",
+        # Wait until the dialog's text boxes can take input
+        try:
+            self._wait_clickable(*LOC_TITLE_TEXTBOX)
+        except TimeoutException:
+            log.error("Failed to rename video title")
+            return
+
+        result = self.driver.execute_script(
+            _SET_DETAILS_JS,
+            self._dialog_root,
+            LOC_TITLE_TEXTBOX[1],
+            LOC_DESCRIPTION_TEXTBOX[1],
+            video_title,
+            seo_keywords,
         )
 
-        if description_input:
-            # Get the Current description text from the input field
-            description = description_input.get_attribute("innerText")
-
-        # Replace the "KEYWORD" placeholder with the the SEO Keywords
-        for keyword in seo_keywords:
-            description = description.replace("KEYWORD", keyword)
-
-        # Replace the "TITLE" placeholder with the video title
-        description = description.replace("TITLE", video_title)
-
-        if description:
-            self.driver.execute_script(
-                """
-                arguments[0].innerText = arguments[1];
-                arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
-            """,
-                description_input,
-                description,
-            )
-            print("Video description is updated")
-            time.sleep(5)
+        if result["title"] or self._type_video_title(video_title):
+            log.info("Video renamed!")
+        else:
+            log.error("Failed to rename video title")
+
+        if result["description"]:
+            log.info("Video description is updated")
         else:
-            print("Error: Failed to set video description")
+            log.error("Error: Failed to set video description")
+
+    def _type_video_title(self, video_title) -> bool:
+        """
+        Type the title with real key presses, for when the scripted one did not stick.
+
+        Args:
+            video_title: Title for the video.
+
+        Returns:
+            bool: True if the title was typed, False if the box was not found.
+        """
+        title_input = self._find_in_dialog(*LOC_TITLE_TEXTBOX)
+        if not title_input:
+            return False
+        title_input.send_keys(Keys.CONTROL, "a")
+        title_input.send_keys(video_title)
+        return True
 
     def expand_more_options(self) -> None:
         """Click 'Show more' button to reveal additional options if not already expanded."""
-        # Try to find the button
-        show_more_button = self.safe_find_element(
-            By.CSS_SELECTOR, "ytcp-button[id='toggle-button']"
-        )
+        # The button renders a little after the dialog's text fields
+        if not self.safe_find_element(*LOC_MORE_OPTIONS_TOGGLE):
+            log.error("Error: Show more button not found!")
+            return
 
-        if show_more_button:
-            button_text = show_more_button.get_attribute("aria-label") or ""
-            text_content = show_more_button.find_element(
-                By.CSS_SELECTOR, ".ytcp-button-shape-impl__button-text-content"
-            ).text
-
-            if "Show more" in button_text or "Show more" in text_content:
-                try:
-                    self.driver.execute_script(
-                        "arguments[0].click();", show_more_button
-                    )
-                    time.sleep(5)
-                except Exception as e:
-                    print(f"Error clicking show more button: {str(e)}")
-            else:
-                print("Options are already expanded")
+        try:
+            state = self.driver.execute_script(
+                _EXPAND_MORE_OPTIONS_JS, LOC_MORE_OPTIONS_TOGGLE[1]
+            )
+        except Exception as e:
+            log.error(f"Error clicking show more button: {str(e)}")
+            return
+
+        if state == "clicked":
+            # Wait for the revealed section to render instead of a fixed pause
+            try:
+                self.wait(10).until(EC.visibility_of_element_located(LOC_TAGS_INPUT))
+            except TimeoutException:
+                log.warning("More options did not appear in time")
+        elif state == "expanded":
+            log.info("Options are already expanded")
         else:
-            print("Error: Show more button not found!")
+            log.error("Error: Show more button not found!")
 
     # TODO: Finish writing these functions.
     def set_video_tags(self, tags_path) -> None:
         """Set video tags from file, up to YouTube's limit."""
-        print("Updating video tags...")
+        log.info("Updating video tags...")
         try:
             # Expand options first to reveal tags input
             self.expand_more_options()
-            time.sleep(3)
 
             # Read tags from second line of file
-            with open(tags_path, "r") as f:
-                next(f)
-                tags = f.readline()
+            tags = read_tags(tags_path)
 
             # Find the default tag and remove it then add it to the beginning of our tags
-            default_tag_text = self.safe_find_element(
-                By.CSS_SELECTOR, "ytcp-chip[id='chip-0'] #chip-text"
-            )
+            # The default tag is optional, so do not wait for it to appear
+            default_tag_text = self._find_now(*LOC_DEFAULT_TAG_TEXT)
             if default_tag_text:
                 default_tag = default_tag_text.text
-                delete_icon = self.safe_find_element(
-                    By.CSS_SELECTOR, "ytcp-chip[id='chip-0'] #delete-icon"
-                )
-                if delete_icon:
-                    self.safe_click(delete_icon)
-                    time.sleep(1)
+                if self.click_when_ready(*LOC_DEFAULT_TAG_DELETE, timeout=10):
+                    try:
+                        self.wait(5).until(EC.staleness_of(default_tag_text))
+                    except TimeoutException:
+                        # Studio may re-render the chip rather than remove it
+                        pass
                     tags = f"{default_tag}, {tags}"
 
             # Ensure tags do not exceed 500 characters
@@ -332,42 +548,26 @@ class YouTubeUploader:
                 tags = tags[:460]
 
             # Find tags input using the exact selector
-            tags_input = self.safe_find_element(
-                By.CSS_SELECTOR,
-                "input.text-input.style-scope.ytcp-chip-bar[aria-label='Tags']",
-            )
-            time.sleep(1)
+            tags_input = self.safe_find_element(*LOC_TAGS_INPUT)
 
             if not tags_input:
-                print("Error: Tags input not found")
+                log.error("Error: Tags input not found")
                 return
 
-            # Set value and trigger events using JavaScript
-            self.driver.execute_script(
-                """
-                var input = arguments[0];
-                input.value = arguments[1];
-                input.dispatchEvent(new Event('input'));
-                input.dispatchEvent(new Event('change'));
-                setTimeout(() => {
-                    input.dispatchEvent(new KeyboardEvent('keydown', {'key': 'Enter'}));
-                    input.dispatchEvent(new KeyboardEvent('keyup', {'key': 'Enter'}));
-                }, 3000);
-                """,
-                tags_input,
-                tags,
-            )
-            time.sleep(2)
-            tags_input.send_keys(Keys.ENTER)
-            time.sleep(1)
-            tags_input.send_keys(Keys.ENTER)
-            tags_input.send_keys(Keys.TAB)
+            # Set value and trigger events using JavaScript, then commit the
+            # chips with real key presses in a single command
+            self.driver.execute_script(_SET_TAGS_JS, tags_input, tags)
+            tags_input.send_keys(Keys.ENTER, Keys.TAB)
 
-            print("Tags are updated!")
-            time.sleep(3)
+            # The input is cleared once Studio has turned the text into chips
+            try:
+                self.wait(10).until(lambda _: not tags_input.get_attribute("value"))
+                log.info("Tags are updated!")
+            except (TimeoutException, StaleElementReferenceException):
+                log.warning("Tags were submitted but not confirmed in time")
 
         except Exception as e:
-            print(f"Error setting tags: {str(e)}")
+            log.error(f"Error setting tags: {str(e)}")
 
     def set_monetization():
         pass
@@ -375,56 +575,97 @@ class YouTubeUploader:
     def set_upload_schedule():
         pass
 
-    def upload_video(self, video_path, current_video, total_videos):
+    def start_upload(self, job: VideoJob, current_video, total_videos) -> bool:
         """
-        Handle video upload process.
+        Upload a video and fill in its details.
 
         Args:
-            video_path: Full path to video file.
+            job: Video to upload.
             current_video: Index of current video.
             total_videos: Total number of videos to upload.
 
-        Raises:
-            TimeoutException: If any upload step times out.
-            Exception: For other upload errors.
-        """
-        video_path = os.path.abspath(video_path)
-        video_filename = os.path.basename(video_path)
-        video_title = os.path.splitext(video_filename)[0]
-        thumbnail_path = self.find_thumbnail(video_path)
-        keywords_path = self.find_keywords(video_path)
-        tags_path = self.find_tags(video_path)
+        Returns:
+            bool: True if the video details were set, False if an error occurred.
+        """
+        video_filename = job.filename
+        video_title = job.title
+        thumbnail_path = find_thumbnail(job.directory, video_title)
+        # Keywords and tags live on the first two lines of the same file
+        keywords_path = find_keywords(job.directory, video_title)
         try:
-            print(f"\nVideo {current_video}/{total_videos}: {video_filename}")
+            log.info(f"\nVideo {current_video}/{total_videos}: {video_filename}")
 
             self.navigate_to_upload_page()
-            self.select_video_file(video_path)
+            self.select_video_file(job.path)
 
             self.wait_for_input_fields()
 
-            self.set_video_title(video_title)
-            self.set_video_description(keywords_path, video_title)
+            self.set_video_details(video_title, keywords_path)
 
             self.focus_upload_dialog()
 
             self.upload_thumbnail(thumbnail_path)
-            self.set_video_tags(tags_path)
-
-            print(f"\nVideo {current_video}/{total_videos} uploaded!")
-            time.sleep(3)
-            print("Preparing next video...")
-            time.sleep(1)
-            print("..")
-            time.sleep(1)
-            print(".")
-            self.driver.get(STUDIO_URL)
+            self.set_video_tags(keywords_path)
+            return True
 
         except TimeoutException as te:
-            print(
-                f"Timeout error: {current_video}/{total_videos} - {video_filename}: {str(te)}"
+            log.error(
+                "Timeout error: %s/%s - %s: %s",
+                current_video,
+                total_videos,
+                video_filename,
+                te,
             )
-        except Exception as e:
-            print(
-                f"Error uploading video {current_video}/{total_videos} - {video_filename}: {str(e)}"
+        except Exception:
+            log.exception(
+                "Error uploading video %s/%s - %s",
+                current_video,
+                total_videos,
+                video_filename,
             )
-            print(f"Traceback: {traceback.format_exc()}")
+        return False
+
+    def finalize_upload(self, current_video, total_videos) -> None:
+        """
+        Report the finished video before the tab is reused.
+
+        Args:
+            current_video: Index of current video.
+            total_videos: Total number of videos to upload.
+        """
+        log.info(f"\nVideo {current_video}/{total_videos} uploaded!")
+        self.close_upload_dialog()
+
+    def close_upload_dialog(self) -> None:
+        """
+        Close the upload dialog so the next video can reuse the loaded page.
+
+        Studio keeps the entered details as a draft and finishes the upload in
+        the background. If the dialog does not close, navigate_to_upload_page
+        reloads Studio instead.
+        """
+        self._dialog_root = None
+        # A failure here only costs the next video a page reload, so it must
+        # not escape and stop the rest of the batch
+        try:
+            if not self.click_when_ready(*LOC_UPLOAD_DIALOG_CLOSE, timeout=5):
+                return
+            self.wait(10).until(
+                EC.invisibility_of_element_located(LOC_UPLOAD_DIALOG_BOX)
+            )
+        except TimeoutException:
+            log.warning("Upload dialog did not close in time")
+        except Exception as e:
+            log.warning(f"Error closing upload dialog: {str(e)}")
+
+    def upload_video(self, job: VideoJob, current_video, total_videos) -> None:
+        """
+        Handle video upload process.
+
+        Args:
+            job: Video to upload.
+            current_video: Index of current video.
+            total_videos: Total number of videos to upload.
+        """
+        if self.start_upload(job, current_video, total_videos):
+            self.finalize_upload(current_video, total_videos)
@@ -0,0 +1,35 @@
+"""
+Import-time checks for the entry point.
+"""
+
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Modules that should only load once an upload backend is set up
+HEAVY_MODULES = (
+    "selenium",
+    "googleapiclient",
+    "utility.uploader",
+    "utility.api_uploader",
+)
+
+
+def test_import_main_does_not_load_selenium():
+    """Importing main must not pull in Selenium or the uploader modules."""
+    code = (
+        "import sys, main; "
+        f"print(','.join(m for m in sys.modules if m.startswith({HEAVY_MODULES!r})))"
+    )
+    env = dict(os.environ, YOUTUBE_STUDIO_URL="https://studio.youtube.com/channel/x")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""